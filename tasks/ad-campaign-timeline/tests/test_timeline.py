@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
 import subprocess
-from copy import deepcopy
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -10,8 +10,15 @@ import pytest
 
 TASK_DIR = Path(__file__).resolve().parents[1]
 SCENARIO_PATH = TASK_DIR / "data" / "scenario.json"
+CAMPAIGN_START = date(2024, 7, 1)
+CAMPAIGN_END = date(2024, 7, 8)
+EXPECTED_DAYS = frozenset(
+    (CAMPAIGN_START + timedelta(days=offset)).isoformat()
+    for offset in range((CAMPAIGN_END - CAMPAIGN_START).days + 1)
+)
 
 
+@functools.lru_cache(maxsize=None)
 def _resolve(path: Path) -> Path:
     if path.exists():
         return path
@@ -24,18 +31,21 @@ def _resolve(path: Path) -> Path:
     raise FileNotFoundError(path)
 
 
-def _run_timeline(payload: dict) -> list[dict]:
-    script = _resolve(TASK_DIR / "campaign" / "aggregator.js")
-    script_ref = json.dumps(str(script))
-    payload_literal = json.dumps(payload)
-    node_snippet = f"""
-const aggregator = require({script_ref});
-const payload = {payload_literal};
+_NODE_RUNNER = """
+const aggregator = require(process.argv[1]);
+const payload = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const before = JSON.stringify(payload);
 const output = aggregator.computeTimeline(payload);
-process.stdout.write(JSON.stringify(output));
+const mutated = JSON.stringify(payload) !== before;
+process.stdout.write(JSON.stringify({ output, mutated }));
 """
+
+
+def _run_timeline(payload: dict) -> tuple[list[dict], bool]:
+    script = _resolve(TASK_DIR / "campaign" / "aggregator.js")
     completed = subprocess.run(
-        ["node", "-e", node_snippet],
+        ["node", "-e", _NODE_RUNNER, str(script)],
+        input=json.dumps(payload),
         capture_output=True,
         text=True,
         cwd=TASK_DIR,
@@ -44,7 +54,8 @@ process.stdout.write(JSON.stringify(output));
         raise RuntimeError(
             f"Node execution failed: {completed.stderr.strip() or completed.stdout}"
         )
-    return json.loads(completed.stdout)
+    result = json.loads(completed.stdout)
+    return result["output"], result["mutated"]
 
 
 @pytest.fixture(scope="module")
@@ -53,84 +64,83 @@ def scenario():
 
 
 @pytest.fixture(scope="module")
-def timeline(scenario):
+def timeline_run(scenario):
     return _run_timeline(scenario)
 
 
-def _lookup(timeline: list[dict], iso_day: str, flight_id: str):
-    for entry in timeline:
-        if entry["date"] == iso_day:
-            return entry["flights"].get(flight_id)
-    return None
+@pytest.fixture(scope="module")
+def timeline(timeline_run):
+    return timeline_run[0]
 
 
-def test_timeline_aligns_with_pause_resume_and_budget_overrides(timeline):
+@pytest.fixture(scope="module")
+def by_day(timeline):
+    return {entry["date"]: entry["flights"] for entry in timeline}
+
+
+def _lookup(by_day: dict[str, dict], iso_day: str, flight_id: str):
+    return by_day.get(iso_day, {}).get(flight_id)
+
+
+def test_timeline_aligns_with_pause_resume_and_budget_overrides(by_day):
     """FlightA reflects overrides, pauses, and resumes on the expected calendar days."""
-    entry = _lookup(timeline, "2024-07-01", "flightA")
+    entry = _lookup(by_day, "2024-07-01", "flightA")
     assert entry == {"status": "active", "budget": 100}
 
-    entry = _lookup(timeline, "2024-07-02", "flightA")
+    entry = _lookup(by_day, "2024-07-02", "flightA")
     assert entry == {"status": "active", "budget": 90}
 
-    entry = _lookup(timeline, "2024-07-05", "flightA")
+    entry = _lookup(by_day, "2024-07-05", "flightA")
     assert entry["status"] == "active"
     assert entry["budget"] == pytest.approx(116.28, rel=0, abs=1e-2)
 
-    entry = _lookup(timeline, "2024-07-06", "flightA")
+    entry = _lookup(by_day, "2024-07-06", "flightA")
     assert entry == {"status": "active", "budget": 100}
 
-    entry = _lookup(timeline, "2024-07-07", "flightA")
+    entry = _lookup(by_day, "2024-07-07", "flightA")
     assert entry["status"] == "active"
     assert entry["budget"] == pytest.approx(38.71, rel=0, abs=1e-2)
 
 
-def test_end_override_truncates_flight_window(timeline):
+def test_end_override_truncates_flight_window(by_day):
     """FlightB respects an end_override that shortens the scheduled run."""
-    assert _lookup(timeline, "2024-07-06", "flightB") is None
-    entry = _lookup(timeline, "2024-07-05", "flightB")
+    assert _lookup(by_day, "2024-07-06", "flightB") is None
+    entry = _lookup(by_day, "2024-07-05", "flightB")
     assert entry["status"] == "active"
     assert entry["budget"] == pytest.approx(87.21, rel=0, abs=1e-2)
 
 
-def test_all_flights_present_each_day_until_end(timeline):
+def test_all_flights_present_each_day_until_end(by_day):
     """Timeline includes every calendar day spanned by the campaign configuration."""
-    expected_days = set()
-    start = date(2024, 7, 1)
-    end = date(2024, 7, 8)
-    current = start
-    while current <= end:
-        expected_days.add(current.isoformat())
-        current += timedelta(days=1)
-    actual_days = {entry["date"] for entry in timeline}
-    assert expected_days.issubset(actual_days)
-
-
-def test_multiple_overrides_use_latest_event_per_day(timeline):
+    assert EXPECTED_DAYS <= by_day.keys()
+
+
+def test_multiple_overrides_use_latest_event_per_day(by_day):
     """The final budget_override event within a day wins over earlier overrides."""
-    entry = _lookup(timeline, "2024-07-02", "flightA")
+    entry = _lookup(by_day, "2024-07-02", "flightA")
     assert entry["budget"] == 90
 
 
-def test_paused_days_ignore_budget_overrides(timeline):
+def test_paused_days_ignore_budget_overrides(by_day):
     """Pause events enforce zero budget even when an override exists the same day."""
-    entry = _lookup(timeline, "2024-07-04", "flightA")
+    entry = _lookup(by_day, "2024-07-04", "flightA")
     assert entry == {"status": "paused", "budget": 0}
 
 
-def test_timezone_conversion_affects_budget_day(timeline):
+def test_timezone_conversion_affects_budget_day(by_day):
     """FlightC adjustments cross time zones and still map to the correct local day."""
-    entry = _lookup(timeline, "2024-07-05", "flightC")
+    entry = _lookup(by_day, "2024-07-05", "flightC")
     assert entry["status"] == "active"
     assert entry["budget"] == pytest.approx(46.51, rel=0, abs=1e-2)
 
-    entry = _lookup(timeline, "2024-07-06", "flightC")
+    entry = _lookup(by_day, "2024-07-06", "flightC")
     assert entry == {"status": "paused", "budget": 0}
 
-    entry = _lookup(timeline, "2024-07-07", "flightC")
+    entry = _lookup(by_day, "2024-07-07", "flightC")
     assert entry["status"] == "active"
     assert entry["budget"] == pytest.approx(81.29, rel=0, abs=1e-2)
 
-    entry = _lookup(timeline, "2024-07-08", "flightC")
+    entry = _lookup(by_day, "2024-07-08", "flightC")
     assert entry == {"status": "active", "budget": 80}
 
 
@@ -141,19 +151,16 @@ def test_flights_sorted_alphabetically_each_day(timeline):
         assert keys == sorted(keys)
 
 
-def test_daily_spend_caps_enforced(timeline):
+def test_daily_spend_caps_enforced(by_day):
     """Total spend on capped days does not exceed the configured limit."""
-    day5 = next(entry for entry in timeline if entry["date"] == "2024-07-05")
-    total_day5 = sum(flight["budget"] for flight in day5["flights"].values())
+    total_day5 = sum(flight["budget"] for flight in by_day["2024-07-05"].values())
     assert total_day5 == pytest.approx(250.0, rel=0, abs=1e-6)
 
-    day7 = next(entry for entry in timeline if entry["date"] == "2024-07-07")
-    total_day7 = sum(flight["budget"] for flight in day7["flights"].values())
+    total_day7 = sum(flight["budget"] for flight in by_day["2024-07-07"].values())
     assert total_day7 == pytest.approx(120.0, rel=0, abs=1e-6)
 
 
-def test_inputs_not_mutated(scenario):
+def test_inputs_not_mutated(timeline_run):
     """computeTimeline must not mutate the provided scenario payload."""
-    snapshot = deepcopy(scenario)
-    _run_timeline(scenario)
-    assert scenario == snapshot
+    _, mutated = timeline_run
+    assert not mutated, "computeTimeline mutated its input payload"
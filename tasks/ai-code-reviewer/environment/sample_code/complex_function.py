@@ -3,54 +3,58 @@
 def VeryLongComplexFunction(data, config, options, flags):
     """This function is way too long and complex"""
     result = []
+    batch_b = []
+    batch_c = []
     counter = 0
 
-    # Process first batch
+    cfg_enabled = bool(config.get('enabled'))
+    opt_transform = bool(options.get('transform'))
+    flg_validate = bool(flags.get('validate'))
+    flg_sort = bool(flags.get('sort'))
+
+    # Process all three batches in one pass, keeping A, B, C order
     for item in data:
-        if item.get('type') == 'A':
-            if item.get('status') == 'active':
-                if item.get('priority') > 5:
-                    if item.get('verified'):
+        get = item.get
+        item_type = get('type')
+        if item_type == 'A':
+            if get('status') == 'active':
+                if get('priority') > 5:
+                    if get('verified'):
                         result.append(item)
                         counter += 1
+        elif item_type == 'B':
+            if get('status') == 'pending':
+                batch_b.append(item)
+        elif item_type == 'C':
+            batch_c.append(item)
+    result += batch_b
+    result += batch_c
 
-    # Process second batch
-    for item in data:
-        if item.get('type') == 'B':
-            if item.get('status') == 'pending':
-                result.append(item)
-
-    # Process third batch
-    for item in data:
-        if item.get('type') == 'C':
-            result.append(item)
-
-    # Additional processing
-    if config.get('enabled'):
-        for r in result:
+    # Mark, transform, validate and count statuses in a single pass
+    kept = [] if flg_validate else None
+    active = pending = 0
+    for r in result:
+        if cfg_enabled:
             r['processed'] = True
-
-    # More processing
-    if options.get('transform'):
-        for r in result:
+        if opt_transform:
             r['transformed'] = True
-
-    # Even more processing
-    if flags.get('validate'):
-        validated = []
-        for r in result:
-            if r.get('valid'):
-                validated.append(r)
-        result = validated
+        if kept is not None:
+            if not r.get('valid'):
+                continue
+            kept.append(r)
+        status = r.get('status')
+        if status == 'active':
+            active += 1
+        elif status == 'pending':
+            pending += 1
+    if kept is not None:
+        result = kept
 
     # Final processing
-    if flags.get('sort'):
-        result = sorted(result, key=lambda x: x.get('priority', 0))
+    if flg_sort:
+        result.sort(key=lambda x: x.get('priority', 0))
 
-    # Calculate statistics
     total = len(result)
-    active = sum(1 for r in result if r.get('status') == 'active')
-    pending = sum(1 for r in result if r.get('status') == 'pending')
 
     # Return results with metadata
     return {
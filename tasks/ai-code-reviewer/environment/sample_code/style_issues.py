@@ -1,12 +1,9 @@
 """Sample with style and maintainability issues"""
+from operator import itemgetter
 
 def CalculateTotal(items):
     """Function name should be snake_case"""
-    total = 0
-    for item in items:
-        total += item['price']
-
-    return total
+    return sum(map(itemgetter('price'), items))
 
 MAX_limit = 100  # Should be MAX_LIMIT
 MinValue = 10    # Should be MIN_VALUE
@@ -1,20 +1,32 @@
 import json
+from collections import Counter
 from pathlib import Path
 
+import pytest
+
+REVIEW_PATH = Path("/app/code_review.json")
+
+VALID_SEVERITIES = frozenset({"critical", "warning", "suggestion"})
+VALID_CATEGORIES = frozenset({
+    "security", "performance", "design", "complexity", "style", "maintainability",
+    "error_handling", "syntax", "file_access", "code_smell"
+})
+VALID_IMPACTS = frozenset({"low", "medium", "high"})
+
+
+@pytest.fixture(scope="session")
+def review():
+    """Parse code_review.json once and share it across every test"""
+    return json.loads(REVIEW_PATH.read_bytes())
+
 
 def test_code_review_json_exists():
     """Test that code review JSON file is created"""
-    review_path = Path("/app/code_review.json")
-    assert review_path.exists(), "code_review.json should exist in /app"
+    assert REVIEW_PATH.exists(), "code_review.json should exist in /app"
 
 
-def test_enhanced_json_structure():
+def test_enhanced_json_structure(review):
     """Test that code review JSON has enhanced structure with all required fields"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     # Check required top-level fields
     required_fields = [
         "overall_score", "files_reviewed", "findings",
@@ -39,13 +51,8 @@ def test_enhanced_json_structure():
     assert isinstance(review["findings"], list), "findings should be a list"
 
 
-def test_statistics_structure():
+def test_statistics_structure(review):
     """Test that statistics section has required fields with correct types"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     statistics = review["statistics"]
     required_stats = [
         "critical", "warning", "suggestion",
@@ -66,13 +73,8 @@ def test_statistics_structure():
         "max_function_length should be integer"
 
 
-def test_findings_structure():
+def test_findings_structure(review):
     """Test that findings have correct structure with all required fields"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     findings = review["findings"]
 
     # Should have at least some findings from sample code
@@ -102,13 +104,8 @@ def test_findings_structure():
         "complexity_impact should be string"
 
 
-def test_score_ranges():
+def test_score_ranges(review):
     """Test that all scores are within valid ranges"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     # Overall score should be 1-10
     assert 1 <= review["overall_score"] <= 10, \
         f"overall_score should be 1-10, got {review['overall_score']}"
@@ -123,13 +120,8 @@ def test_score_ranges():
         f"security_score should be 1.0-10.0, got {review['security_score']}"
 
 
-def test_fix_confidence_range():
+def test_fix_confidence_range(review):
     """Test that fix confidence scores are within 0-1 range"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     for finding in review["findings"]:
         confidence = finding["fix_confidence"]
         assert 0.0 <= confidence <= 1.0, \
@@ -137,58 +129,26 @@ def test_fix_confidence_range():
                 {finding['issue']}"
 
 
-def test_severity_values():
+def test_severity_values(review):
     """Test that severity values are valid"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
+    invalid = {f["severity"] for f in review["findings"]} - VALID_SEVERITIES
+    assert not invalid, f"Invalid severity: {invalid}"
 
-    valid_severities = {"critical", "warning", "suggestion"}
 
-    for finding in review["findings"]:
-        assert finding["severity"] in valid_severities, \
-            f"Invalid severity: {finding['severity']}"
-
-
-def test_category_values():
+def test_category_values(review):
     """Test that category values are valid"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
-    valid_categories = {
-        "security", "performance", "design", "complexity", "style", "maintainability",
-        "error_handling", "syntax", "file_access", "code_smell"
-    }
-
-    for finding in review["findings"]:
-        assert finding["category"] in valid_categories, \
-            f"Invalid category: {finding['category']}"
+    invalid = {f["category"] for f in review["findings"]} - VALID_CATEGORIES
+    assert not invalid, f"Invalid category: {invalid}"
 
 
-def test_complexity_impact_values():
+def test_complexity_impact_values(review):
     """Test that complexity_impact values are valid"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
-    valid_impacts = {"low", "medium", "high"}
-
-    for finding in review["findings"]:
-        assert finding["complexity_impact"] in valid_impacts, \
-            f"Invalid complexity_impact: {finding['complexity_impact']}"
+    invalid = {f["complexity_impact"] for f in review["findings"]} - VALID_IMPACTS
+    assert not invalid, f"Invalid complexity_impact: {invalid}"
 
 
-def test_detects_multiple_categories():
+def test_detects_multiple_categories(review):
     """Test that reviewer detects issues across multiple categories"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     categories_found = set()
     for finding in review["findings"]:
         categories_found.add(finding["category"])
@@ -198,13 +158,8 @@ def test_detects_multiple_categories():
         f"Should detect multiple issue categories, found: {categories_found}"
 
 
-def test_detects_security_issues():
+def test_detects_security_issues(review):
     """Test that security vulnerabilities are detected"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     security_findings = [f for f in review["findings"] if f["category"] == "security"]
 
     # Sample code has multiple security issues
@@ -212,13 +167,8 @@ def test_detects_security_issues():
         "Should detect security vulnerabilities in sample code"
 
 
-def test_detects_naming_issues():
+def test_detects_naming_issues(review):
     """Test that naming convention violations are detected"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     # Look for style category findings (which includes naming)
     style_findings = [f for f in review["findings"] if f["category"] == "style"]
 
@@ -226,13 +176,8 @@ def test_detects_naming_issues():
         "Should detect naming/style convention violations"
 
 
-def test_detects_design_issues():
+def test_detects_design_issues(review):
     """Test that design/complexity issues are detected"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     # Accept both "design" and "complexity" categories
     design_findings = [
         f for f in review["findings"]
@@ -245,29 +190,17 @@ def test_detects_design_issues():
             complexity, long functions, deep nesting)"
 
 
-def test_total_issues_consistency():
+def test_total_issues_consistency(review):
     """Test that total_issues matches findings count"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     assert review["total_issues"] == len(review["findings"]), \
         f"total_issues ({review['total_issues']}) should match findings count \
             ({len(review['findings'])})"
 
 
-def test_statistics_consistency():
+def test_statistics_consistency(review):
     """Test that statistics counts match findings"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     # Count severities in findings
-    severity_counts = {"critical": 0, "warning": 0, "suggestion": 0}
-    for finding in review["findings"]:
-        severity_counts[finding["severity"]] += 1
+    severity_counts = Counter(f["severity"] for f in review["findings"])
 
     # Should match statistics
     stats = review["statistics"]
@@ -282,13 +215,8 @@ def test_statistics_consistency():
             actual={severity_counts['suggestion']}"
 
 
-def test_files_reviewed():
+def test_files_reviewed(review):
     """Test that files_reviewed count is correct"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     # Should have reviewed at least 1 file
     assert review["files_reviewed"] > 0, "Should review at least one Python file"
 
@@ -300,13 +228,8 @@ def test_files_reviewed():
         "files_reviewed should be >= unique files in findings"
 
 
-def test_complexity_metrics():
+def test_complexity_metrics(review):
     """Test that complexity metrics are calculated"""
-    review_path = Path("/app/code_review.json")
-
-    with open(review_path, 'r', encoding='utf-8') as f:
-        review = json.load(f)
-
     stats = review["statistics"]
 
     # Should calculate complexity metrics if code was analyzed